@@ -1,11 +1,20 @@
 """Command-line design utilities for Ceradon UxS Architect.
 
 The package is intentionally lightweight so it can run on SBCs like
-Raspberry Pi or Jetson Nano without external dependencies.
+Raspberry Pi or Jetson Nano without external dependencies. Submodules
+are imported on first attribute access to keep CLI startup lean.
 """
 
+from importlib import import_module
+
 __all__ = [
     "catalog_loader",
     "design",
     "cli",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,139 @@
+"""JSON encode/decode helpers for catalogs and MissionProject bundles.
+
+``orjson`` is used when installed; otherwise the stdlib ``json`` module is
+used so the CLI keeps running on SBCs without third-party packages.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+if TYPE_CHECKING:
+    import json
+    from types import ModuleType
+
+
+@lru_cache(maxsize=None)
+def _orjson() -> ModuleType | None:
+    # Imported on first use: orjson pulls in uuid, enum and zoneinfo, which
+    # commands such as --help never need.
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return orjson
+
+
+# Serializer per dataclass type, built from its fields on first sight.
+_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _dataclass_serializer(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    from dataclasses import fields
+
+    names = tuple(f.name for f in fields(cls))
+    return lambda o: {name: getattr(o, name) for name in names}
+
+
+def _default(o: Any) -> Dict[str, Any]:
+    """Stdlib ``default`` hook; orjson serializes dataclasses natively."""
+
+    serialize = _SERIALIZERS.get(type(o))
+    if serialize is None:
+        from dataclasses import is_dataclass
+
+        if not is_dataclass(o) or isinstance(o, type):
+            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+        serialize = _SERIALIZERS[type(o)] = _dataclass_serializer(type(o))
+    return serialize(o)
+
+
+@lru_cache(maxsize=None)
+def _encoder(indent: bool, ensure_ascii: bool = False) -> json.JSONEncoder:
+    # Built on first use so the orjson path never loads the stdlib encoder.
+    # ``ensure_ascii=False`` matches orjson, which always emits raw UTF-8.
+    import json
+
+    return json.JSONEncoder(ensure_ascii=ensure_ascii, indent=2 if indent else None, default=_default)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from ``bytes`` or ``str``."""
+
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize ``obj``; ``indent`` selects two-space pretty printing."""
+
+    orjson = _orjson()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return _encoder(indent).encode(obj)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded bytes."""
+
+    orjson = _orjson()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option)
+    return _encoder(indent).encode(obj).encode("utf-8")
+
+
+def _stdout_codec() -> str | None:
+    import codecs
+
+    encoding = getattr(sys.stdout, "encoding", None)
+    if not encoding:
+        return None
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return encoding
+
+
+def print_json(obj: Any, indent: bool = False) -> None:
+    """Print ``obj`` as JSON, writing encoded bytes straight to stdout when possible.
+
+    The byte path is only taken when it is indistinguishable from ``print``:
+    a UTF-8 stdout with no newline translation. Other consoles get non-ASCII
+    text as ``\\u`` escapes so output never fails to encode.
+    """
+
+    codec = _stdout_codec()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if codec == "utf-8" and buffer is not None and os.linesep == "\n":
+        # Keep ordering with anything already print()ed through the text layer.
+        sys.stdout.flush()
+        buffer.write(dumps_bytes(obj, indent=indent))
+        buffer.write(b"\n")
+    elif codec is None or codec == "utf-8":
+        print(dumps(obj, indent=indent))
+    else:
+        print(_encoder(indent, ensure_ascii=True).encode(obj))
+
+
+def write_json(path: str | Path, obj: Any, indent: bool = False) -> None:
+    """Serialize ``obj`` straight to ``path`` without an intermediate ``str``."""
+
+    orjson = _orjson()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        with open(path, "wb") as handle:
+            handle.write(orjson.dumps(obj, option=option))
+        return
+    # newline="" keeps "\n" on every platform, matching the orjson bytes.
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        handle.writelines(_encoder(indent).iterencode(obj))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict
 
+from ._json import loads
+
 DEFAULT_CATALOG_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "catalog.json"
 
 
@@ -15,8 +16,9 @@ def load_catalog(path: Path | str | None = None) -> Dict[str, Any]:
     """
 
     catalog_path = Path(path) if path else DEFAULT_CATALOG_PATH
-    if not catalog_path.exists():
-        raise FileNotFoundError(f"Catalog not found: {catalog_path}")
+    try:
+        data = catalog_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Catalog not found: {catalog_path}") from None
 
-    with catalog_path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return loads(data)
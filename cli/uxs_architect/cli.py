@@ -1,54 +1,39 @@
 from __future__ import annotations
 
 import argparse
-import json
+import sys
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
 
+from ._json import dumps_bytes, loads, print_json, write_json
 from .catalog_loader import load_catalog
-from .design import (
-    ComponentSelection,
-    ConstraintSettings,
-    DesignResult,
-    Environment,
-    ALTITUDE_BANDS,
-    TEMPERATURE_BANDS,
-    evaluate_design,
-    list_category,
-    recommended_roles,
-)
+from .design_constants import ALTITUDE_BANDS, TEMPERATURE_BANDS
+
+if TYPE_CHECKING:
+    from .design import ComponentSelection, DesignResult, Environment
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 WHITEFROST_PATH = BASE_DIR / "data" / "whitefrost_mission_project.json"
 MISSIONPROJECT_SCHEMA_VERSION = "2.0.0"
 
 
-class CompactJSONEncoder(json.JSONEncoder):
-    def default(self, o: Any):  # type: ignore[override]
-        if isinstance(o, DesignResult):
-            return o.__dict__
-        if isinstance(o, ComponentSelection):
-            return o.__dict__
-        if isinstance(o, Environment):
-            return o.__dict__
-        if isinstance(o, ConstraintSettings):
-            return o.__dict__
-        return super().default(o)
-
-
 def _print_table(items: List[Dict[str, Any]], columns: List[str]) -> None:
     if not items:
         print("(no entries)")
         return
-    widths = {col: max(len(col), max(len(str(item.get(col, ""))) for item in items)) for col in columns}
-    header = " | ".join(col.ljust(widths[col]) for col in columns)
-    print(header)
-    print("-+-".join("-" * widths[col] for col in columns))
-    for item in items:
-        print(" | ".join(str(item.get(col, "")).ljust(widths[col]) for col in columns))
+    rows = [[str(item.get(col, "")) for col in columns] for item in items]
+    widths = [max(len(col), max(len(row[i]) for row in rows)) for i, col in enumerate(columns)]
+    row_format = " | ".join(f"{{:<{width}}}" for width in widths)
+    lines = [row_format.format(*columns), "-+-".join("-" * width for width in widths)]
+    lines.extend(row_format.format(*row) for row in rows)
+    print("\n".join(lines))
 
 
 def handle_list(catalog: Dict[str, Any], args: argparse.Namespace) -> None:
+    from .design import list_category
+
     items = list_category(catalog, args.category)
     columns = ["id", "name"]
     sample = items[0] if items else {}
@@ -59,6 +44,8 @@ def handle_list(catalog: Dict[str, Any], args: argparse.Namespace) -> None:
 
 
 def handle_roles(catalog: Dict[str, Any], args: argparse.Namespace) -> None:
+    from .design import recommended_roles
+
     matches = recommended_roles(catalog, args.role)
     if not matches:
         print(f"No payloads tagged with role '{args.role}'")
@@ -79,9 +66,15 @@ def _sanitize_location(loc: Dict[str, Any] | None) -> Dict[str, float] | None:
     return cleaned
 
 
+# Keyed by id(item) so the GeoJSON and CoT exporters can share one pass.
+def _sanitize_bundle_locations(bundle: Dict[str, Any]) -> Dict[int, Dict[str, float] | None]:
+    items = chain(bundle.get("nodes") or (), bundle.get("platforms") or ())
+    return {id(item): _sanitize_location(item.get("location")) for item in items}
+
+
 def load_mission_project(path: str | Path) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads(f.read())
 
 
 def _field(entry: Dict[str, Any], *names: str) -> Any:
@@ -160,94 +153,122 @@ def upgrade_mission_project(bundle: Dict[str, Any]) -> Dict[str, Any]:
 
 def mission_project_to_geojson(project: Dict[str, Any]) -> Dict[str, Any]:
     base_bundle = project.get("mission_project") or project
-    bundle = upgrade_mission_project(base_bundle)
-    features: List[Dict[str, Any]] = []
+    return _bundle_to_geojson(upgrade_mission_project(base_bundle))
+
+
+def _bundle_to_geojson(bundle: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "FeatureCollection", "features": list(_iter_geojson_features(bundle))}
 
-    def push_point(item: Dict[str, Any], feature_type: str) -> None:
-        loc = _sanitize_location(item.get("location"))
+
+def _iter_geojson_features(
+    bundle: Dict[str, Any], locations: Dict[int, Dict[str, float] | None] | None = None
+) -> Iterator[Dict[str, Any]]:
+    nodes = bundle.get("nodes") or ()
+    platforms = bundle.get("platforms") or ()
+    link_groups = (bundle.get("meshLinks") or (), bundle.get("mesh_links") or ())
+    has_links = any(link_groups)
+    bundle_origin = bundle.get("origin_tool", "uxs")
+
+    loc_index: Dict[str, Dict[str, float]] = {}
+    points = chain(((node, "node") for node in nodes), ((platform, "platform") for platform in platforms))
+    for item, feature_type in points:
+        get = item.get
+        loc = locations[id(item)] if locations is not None else _sanitize_location(get("location"))
         if not loc:
-            return
+            continue
+        item_id = get("id")
+        if has_links:
+            loc_index[item_id] = loc
         coords = [loc["lon"], loc["lat"]]
         if "elevation_m" in loc:
             coords.append(loc["elevation_m"])
-        roles = _field(item, "role", "role_tags", "mission_roles", "missionRoles") or []
-        features.append(
-            {
-                "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": coords},
-                "properties": {
-                    "id": item.get("id"),
-                    "name": item.get("name"),
-                    "type": feature_type,
-                    "origin_tool": item.get("origin_tool", bundle.get("origin_tool", "uxs")),
-                    "role": roles,
-                    "rf_band_ghz": _field(item, "rf_band_ghz", "rfBandGhz"),
-                    "rf_bands_ghz": _field(item, "rf_bands_ghz", "rfBandsGhz"),
-                    "power_draw_w": _field(item, "power_draw_w", "powerDrawW"),
-                    "power_budget_w": _field(item, "power_budget_w", "powerBudgetW"),
-                    "environment_ref": _field(item, "environment_ref", "environmentRef"),
-                    "constraints_ref": _field(item, "constraints_ref", "constraintsRef"),
-                },
-            }
-        )
-
-    for node in bundle.get("nodes", []):
-        push_point(node, "node")
-    for platform in bundle.get("platforms", []):
-        push_point(platform, "platform")
-
-    loc_index: Dict[str, Dict[str, float]] = {}
-    for node in bundle.get("nodes", []):
-        loc = _sanitize_location(node.get("location"))
-        if loc:
-            loc_index[node.get("id")] = loc
-    for platform in bundle.get("platforms", []):
-        loc = _sanitize_location(platform.get("location"))
-        if loc:
-            loc_index[platform.get("id")] = loc
-
-    for link in bundle.get("meshLinks", []) + bundle.get("mesh_links", []):
-        a = loc_index.get(link.get("from"))
-        b = loc_index.get(link.get("to"))
+        yield {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": coords},
+            "properties": {
+                "id": item_id,
+                "name": get("name"),
+                "type": feature_type,
+                "origin_tool": get("origin_tool", bundle_origin),
+                "role": _field(item, "role", "role_tags", "mission_roles", "missionRoles") or [],
+                "rf_band_ghz": _field(item, "rf_band_ghz", "rfBandGhz"),
+                "rf_bands_ghz": _field(item, "rf_bands_ghz", "rfBandsGhz"),
+                "power_draw_w": _field(item, "power_draw_w", "powerDrawW"),
+                "power_budget_w": _field(item, "power_budget_w", "powerBudgetW"),
+                "environment_ref": _field(item, "environment_ref", "environmentRef"),
+                "constraints_ref": _field(item, "constraints_ref", "constraintsRef"),
+            },
+        }
+
+    locate = loc_index.get
+    for link in chain.from_iterable(link_groups):
+        get = link.get
+        a = locate(get("from"))
+        b = locate(get("to"))
         if not a or not b:
             continue
-        features.append(
-            {
-                "type": "Feature",
-                "geometry": {"type": "LineString", "coordinates": [[a["lon"], a["lat"]], [b["lon"], b["lat"]]]},
-                "properties": {
-                    "id": link.get("id"),
-                    "name": link.get("name", link.get("id")),
-                    "type": "mesh_link",
-                    "origin_tool": link.get("origin_tool", "mesh"),
-                    "rf_band_ghz": link.get("rf_band_ghz"),
-                    "notes": link.get("notes"),
-                },
-            }
-        )
-
-    return {"type": "FeatureCollection", "features": features}
+        link_id = get("id")
+        yield {
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": [[a["lon"], a["lat"]], [b["lon"], b["lat"]]]},
+            "properties": {
+                "id": link_id,
+                "name": get("name", link_id),
+                "type": "mesh_link",
+                "origin_tool": get("origin_tool", "mesh"),
+                "rf_band_ghz": get("rf_band_ghz"),
+                "notes": get("notes"),
+            },
+        }
+
+
+def write_geojson_stream(
+    bundle: Dict[str, Any], path: str | Path, locations: Dict[int, Dict[str, float] | None] | None = None
+) -> None:
+    # Sanitize up front so bad locations fail before the target is truncated.
+    if locations is None:
+        locations = _sanitize_bundle_locations(bundle)
+    with open(path, "wb") as handle:
+        write = handle.write
+        write(b'{\n  "type": "FeatureCollection",\n  "features": [')
+        separator = b"\n    "
+        for feature in _iter_geojson_features(bundle, locations):
+            write(separator)
+            write(dumps_bytes(feature, indent=True).replace(b"\n", b"\n    "))
+            separator = b",\n    "
+        write(b"]\n}" if separator == b"\n    " else b"\n  ]\n}")
 
 
 def mission_project_to_cot(project: Dict[str, Any]) -> Dict[str, Any]:
     base_bundle = project.get("mission_project") or project
-    bundle = upgrade_mission_project(base_bundle)
+    return _bundle_to_cot(upgrade_mission_project(base_bundle))
+
+
+def _bundle_to_cot(
+    bundle: Dict[str, Any], locations: Dict[int, Dict[str, float] | None] | None = None
+) -> Dict[str, Any]:
+    nodes = bundle.get("nodes") or ()
+    platforms = bundle.get("platforms") or ()
+    bundle_origin = bundle.get("origin_tool", "uxs")
     events: List[Dict[str, Any]] = []
+    append_event = events.append
 
-    def push_event(item: Dict[str, Any], type_code: str) -> None:
-        loc = _sanitize_location(item.get("location"))
+    entries = chain(((platform, "a-f-A-M-UxS") for platform in platforms), ((node, "b-r-f") for node in nodes))
+    for item, type_code in entries:
+        get = item.get
+        loc = locations[id(item)] if locations is not None else _sanitize_location(get("location"))
         if not loc:
-            return
+            continue
         roles = _field(item, "missionRoles", "mission_roles", "role") or []
-        events.append(
+        append_event(
             {
-                "id": item.get("id"),
+                "id": get("id"),
                 "type": type_code,
                 "how": "m-g",
-                "remarks": f"{item.get('name')} ({', '.join(roles) or 'unspecified'})",
+                "remarks": f"{get('name')} ({', '.join(roles) or 'unspecified'})",
                 "point": {"lat": loc["lat"], "lon": loc["lon"], "hae": loc.get("elevation_m")},
                 "detail": {
-                    "origin_tool": item.get("origin_tool", bundle.get("origin_tool", "uxs")),
+                    "origin_tool": get("origin_tool", bundle_origin),
                     "rf_band_ghz": _field(item, "rf_band_ghz", "rfBandGhz"),
                     "rf_bands_ghz": _field(item, "rf_bands_ghz", "rfBandsGhz"),
                     "power_draw_w": _field(item, "power_draw_w", "powerDrawW"),
@@ -257,53 +278,56 @@ def mission_project_to_cot(project: Dict[str, Any]) -> Dict[str, Any]:
                 },
             }
         )
-
-    for platform in bundle.get("platforms", []):
-        push_event(platform, "a-f-A-M-UxS")
-    for node in bundle.get("nodes", []):
-        push_event(node, "b-r-f")
     return {"events": events}
 
 
 
 def _normalize_nodes(bundle: dict) -> list[dict]:
     nodes: list[dict] = []
-    for node in bundle.get("nodes", []):
+    append_node = nodes.append
+    for node in bundle.get("nodes", ()):
+        node_id = node.get("id") or node.get("node_id") or node.get("uuid") or node.get("name")
+        if not node_id:
+            continue
         weight_grams = node.get("weight_grams") or node.get("weightGrams")
-        if weight_grams is None and node.get("mass_kg") is not None:
-            weight_grams = float(node["mass_kg"]) * 1000
-        power_w = node.get("power_draw_w") or node.get("powerDrawW") or node.get("power_w") or 0.0
-        roles = node.get("role") or node.get("role_tags") or node.get("roles") or []
-        nodes.append(
+        if weight_grams is None:
+            mass_kg = node.get("mass_kg")
+            if mass_kg is not None:
+                weight_grams = float(mass_kg) * 1000
+        weight_grams = weight_grams or 0.0
+        append_node(
             {
-                "id": node.get("id") or node.get("node_id") or node.get("uuid") or node.get("name"),
+                "id": node_id,
                 "name": node.get("name", "Imported node"),
-                "weight_grams": weight_grams or 0.0,
-                "mass_kg": (weight_grams or 0.0) / 1000,
-                "power_draw_w": power_w,
-                "role_tags": roles,
+                "weight_grams": weight_grams,
+                "mass_kg": weight_grams / 1000,
+                "power_draw_w": node.get("power_draw_w") or node.get("powerDrawW") or node.get("power_w") or 0.0,
+                "role_tags": node.get("role") or node.get("role_tags") or node.get("roles") or [],
                 "rf_band_ghz": node.get("rf_band_ghz"),
                 "origin_tool": node.get("origin_tool", "node"),
                 "notes": node.get("notes", "Imported from MissionProject"),
             }
         )
-    return [n for n in nodes if n.get("id")]
+    return nodes
 
 
 def _extend_catalog_with_nodes(catalog: dict, nodes: list[dict]) -> dict:
     if not nodes:
         return catalog
-    augmented = {**catalog}
-    augmented.setdefault("payloads", [])
-    augmented.setdefault("compute", [])
-    augmented.setdefault("radios", [])
+    # Copy only the lists we append to so the caller's catalog is left untouched.
+    augmented = dict(catalog)
+    for category in ("payloads", "compute", "radios"):
+        augmented[category] = list(catalog.get(category, []))
+    append_payload = augmented["payloads"].append
+    append_compute = augmented["compute"].append
+    append_radio = augmented["radios"].append
     for node in nodes:
         base_id = str(node["id"])
         mass_kg = round(float(node.get("mass_kg", 0.0)), 3)
         power_w = round(float(node.get("power_draw_w", 0.0)), 2)
         roles = node.get("role_tags") or []
         notes = node.get("notes", "Imported node component")
-        augmented["payloads"].append(
+        append_payload(
             {
                 "id": f"{base_id}-payload",
                 "name": f"{node['name']} (payload)",
@@ -313,7 +337,7 @@ def _extend_catalog_with_nodes(catalog: dict, nodes: list[dict]) -> dict:
                 "notes": notes,
             }
         )
-        augmented["compute"].append(
+        append_compute(
             {
                 "id": f"{base_id}-compute",
                 "name": f"{node['name']} (compute)",
@@ -324,7 +348,7 @@ def _extend_catalog_with_nodes(catalog: dict, nodes: list[dict]) -> dict:
                 "notes": notes,
             }
         )
-        augmented["radios"].append(
+        append_radio(
             {
                 "id": f"{base_id}-radio",
                 "name": f"{node['name']} (radio)",
@@ -358,8 +382,8 @@ def build_mission_platform(
         "adjustedEnduranceMin": result.adjusted_endurance_min,
         "thrustToWeight": result.thrust_to_weight,
         "adjustedThrustToWeight": result.adjusted_thrust_to_weight,
-        "mountedNodeIds": list(selection.mounted_nodes),
-        "payloadIds": list(selection.payloads),
+        "mountedNodeIds": selection.mounted_nodes,
+        "payloadIds": selection.payloads,
         "intendedRoles": intended_roles or result.role_tags,
         "environment": {
             "altitudeBand": environment.altitude_band,
@@ -385,6 +409,8 @@ def build_mission_platform(
 
 
 def handle_evaluate(catalog: Dict[str, Any], args: argparse.Namespace) -> None:
+    from .design import ComponentSelection, ConstraintSettings, Environment, evaluate_design
+
     imported_nodes: List[Dict[str, Any]] = []
     if args.mission_project:
         mission_data = load_mission_project(args.mission_project)
@@ -412,7 +438,7 @@ def handle_evaluate(catalog: Dict[str, Any], args: argparse.Namespace) -> None:
     )
     result = evaluate_design(catalog, selection, environment=environment, constraints=constraints)
     if args.json:
-        print(json.dumps(result, cls=CompactJSONEncoder, indent=2))
+        print_json(result, indent=True)
         if args.mission_out:
             bundle = build_mission_platform(
                 selection,
@@ -423,28 +449,31 @@ def handle_evaluate(catalog: Dict[str, Any], args: argparse.Namespace) -> None:
                 platform_name=args.platform_name,
                 nodes=imported_nodes,
             )
-            Path(args.mission_out).write_text(json.dumps(bundle, indent=2), encoding="utf-8")
+            write_json(args.mission_out, bundle, indent=True)
         return
 
-    print(f"Frame: {selection.frame}\nPropulsion: {selection.propulsion}\nBattery: {selection.battery}")
-    print(f"Compute: {selection.compute}\nRadio: {selection.radio}\nPayloads: {', '.join(selection.payloads) or 'none'}\n")
-    print(f"All-up weight: {result.mass_kg:.2f} kg")
-    print(f"Payload margin: {result.payload_margin_kg:.2f} kg")
-    print(f"Thrust-to-weight: {result.thrust_to_weight:.2f} (adjusted: {result.adjusted_thrust_to_weight:.2f})")
-    print(f"Power budget: {result.power_budget_w:.1f} W")
-    print(
+    lines = [
+        f"Frame: {selection.frame}",
+        f"Propulsion: {selection.propulsion}",
+        f"Battery: {selection.battery}",
+        f"Compute: {selection.compute}",
+        f"Radio: {selection.radio}",
+        f"Payloads: {', '.join(selection.payloads) or 'none'}",
+        "",
+        f"All-up weight: {result.mass_kg:.2f} kg",
+        f"Payload margin: {result.payload_margin_kg:.2f} kg",
+        f"Thrust-to-weight: {result.thrust_to_weight:.2f} (adjusted: {result.adjusted_thrust_to_weight:.2f})",
+        f"Power budget: {result.power_budget_w:.1f} W",
         "Est. endurance: "
-        f"{result.estimated_endurance_min:.1f} min nominal / {result.adjusted_endurance_min:.1f} min env-adjusted"
-    )
-    print(
+        f"{result.estimated_endurance_min:.1f} min nominal / {result.adjusted_endurance_min:.1f} min env-adjusted",
         f"Environment: {ALTITUDE_BANDS[result.environment.altitude_band]['label']}, "
-        f"{TEMPERATURE_BANDS[result.environment.temperature_band]['label']}"
-    )
-    print(f"Role tags: {', '.join(result.role_tags)}")
+        f"{TEMPERATURE_BANDS[result.environment.temperature_band]['label']}",
+        f"Role tags: {', '.join(result.role_tags)}",
+    ]
     if result.warnings:
-        print("\nWarnings:")
-        for warn in result.warnings:
-            print(f"- {warn}")
+        lines.append("\nWarnings:")
+        lines.extend(f"- {warn}" for warn in result.warnings)
+    sys.stdout.write("\n".join(lines) + "\n")
 
     if args.mission_out:
         bundle = build_mission_platform(
@@ -456,7 +485,7 @@ def handle_evaluate(catalog: Dict[str, Any], args: argparse.Namespace) -> None:
             platform_name=args.platform_name,
             nodes=imported_nodes,
         )
-        Path(args.mission_out).write_text(json.dumps(bundle, indent=2), encoding="utf-8")
+        write_json(args.mission_out, bundle, indent=True)
         print(f"MissionProject written to {args.mission_out}")
 
 def handle_mission(_: Dict[str, Any], args: argparse.Namespace) -> None:
@@ -472,33 +501,35 @@ def handle_mission(_: Dict[str, Any], args: argparse.Namespace) -> None:
         f"nodes: {len(bundle.get('nodes', []))} | mesh links: {len(bundle.get('meshLinks', []))}"
     )
 
+    locations = _sanitize_bundle_locations(bundle) if args.geojson_out and args.cot_out else None
     if args.geojson_out:
-        geojson = mission_project_to_geojson(project)
-        Path(args.geojson_out).write_text(json.dumps(geojson, indent=2), encoding="utf-8")
+        write_geojson_stream(bundle, args.geojson_out, locations)
         print(f"GeoJSON written to {args.geojson_out}")
     if args.cot_out:
-        cot = mission_project_to_cot(project)
-        Path(args.cot_out).write_text(json.dumps(cot, indent=2), encoding="utf-8")
+        cot = _bundle_to_cot(bundle, locations)
+        write_json(args.cot_out, cot, indent=True)
         print(f"CoT stub written to {args.cot_out}")
     if not args.geojson_out and not args.cot_out:
         project_out = {"mission_project": bundle} if project.get("mission_project") else bundle
-        print(json.dumps(project_out, indent=2))
+        print_json(project_out, indent=True)
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Ceradon UxS Architect CLI")
-    parser.add_argument("--catalog", default=None, help="Path to catalog JSON (defaults to data/catalog.json)")
+LIST_CATEGORIES = ("frames", "propulsion", "batteries", "compute", "radios", "payloads")
 
-    sub = parser.add_subparsers(dest="command", required=True)
 
+def _add_list_parser(sub: argparse._SubParsersAction) -> None:
     list_parser = sub.add_parser("list", help="List catalog entries")
-    list_parser.add_argument("category", choices=["frames", "propulsion", "batteries", "compute", "radios", "payloads"])
+    list_parser.add_argument("category", choices=list(LIST_CATEGORIES))
     list_parser.set_defaults(func=handle_list)
 
+
+def _add_roles_parser(sub: argparse._SubParsersAction) -> None:
     role_parser = sub.add_parser("roles", help="Show payloads that satisfy a role tag")
     role_parser.add_argument("role")
     role_parser.set_defaults(func=handle_roles)
 
+
+def _add_evaluate_parser(sub: argparse._SubParsersAction) -> None:
     eval_parser = sub.add_parser("evaluate", help="Evaluate a specific design stack")
     eval_parser.add_argument("--frame", required=True)
     eval_parser.add_argument("--propulsion", required=True)
@@ -530,6 +561,8 @@ def build_parser() -> argparse.ArgumentParser:
     eval_parser.add_argument("--json", action="store_true", help="Emit JSON instead of text")
     eval_parser.set_defaults(func=handle_evaluate)
 
+
+def _add_mission_parser(sub: argparse._SubParsersAction) -> None:
     mission_parser = sub.add_parser("mission", help="Import/export MissionProject bundles")
     mission_source = mission_parser.add_mutually_exclusive_group(required=True)
     mission_source.add_argument("--whitefrost", action="store_true", help="Emit the Project WHITEFROST preset")
@@ -538,12 +571,67 @@ def build_parser() -> argparse.ArgumentParser:
     mission_parser.add_argument("--cot-out", help="Write CoT-like JSON stub to file")
     mission_parser.set_defaults(func=handle_mission)
 
+
+SUBCOMMANDS = {
+    "list": _add_list_parser,
+    "roles": _add_roles_parser,
+    "evaluate": _add_evaluate_parser,
+    "mission": _add_mission_parser,
+}
+
+
+# Memoized per subcommand; callers must not mutate the returned parser.
+@lru_cache(maxsize=None)
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Ceradon UxS Architect CLI")
+    parser.add_argument("--catalog", default=None, help="Path to catalog JSON (defaults to data/catalog.json)")
+
+    if command is not None:
+        # Keep usage listing every subcommand, as the full parser does.
+        sub = parser.add_subparsers(dest="command", required=True, metavar="{" + ",".join(SUBCOMMANDS) + "}")
+        SUBCOMMANDS[command](sub)
+    else:
+        sub = parser.add_subparsers(dest="command", required=True)
+        for add_subparser in SUBCOMMANDS.values():
+            add_subparser(sub)
+
     return parser
 
 
+# None sends top-level help, unknown options and unknown commands to the full parser.
+def _sniff_subcommand(argv: List[str]) -> str | None:
+    tokens = iter(argv)
+    for token in tokens:
+        if token == "--catalog":
+            next(tokens, None)
+            continue
+        if token.startswith("--catalog="):
+            continue
+        if token.startswith("-"):
+            return None
+        return token if token in SUBCOMMANDS else None
+    return None
+
+
+# Bare `list <category>` / `roles <role>` skip argparse; anything else returns None.
+def _parse_simple(argv: List[str]) -> argparse.Namespace | None:
+    if len(argv) != 2:
+        return None
+    command, value = argv
+    if command == "list" and value in LIST_CATEGORIES:
+        return argparse.Namespace(catalog=None, command=command, category=value, func=handle_list)
+    if command == "roles" and not value.startswith("-"):
+        return argparse.Namespace(catalog=None, command=command, role=value, func=handle_roles)
+    return None
+
+
 def main(argv: List[str] | None = None) -> None:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_simple(argv)
+    if args is None:
+        parser = build_parser(_sniff_subcommand(argv))
+        args = parser.parse_args(argv)
     catalog = load_catalog(args.catalog)
     args.func(catalog, args)
 
@@ -1,39 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
-Catalog = Dict[str, List[Dict[str, object]]]
+from .design_constants import ALTITUDE_BANDS, TEMPERATURE_BANDS
 
+Catalog = Dict[str, List[Dict[str, object]]]
 
-ALTITUDE_BANDS = {
-    "sea_level": {"label": "Sea level (0-500m)", "thrust_efficiency": 1.0, "power_penalty": 0.0},
-    "high_desert": {"label": "High desert (1.5-2.5km)", "thrust_efficiency": 0.9, "power_penalty": 0.12},
-    "mountain": {"label": "Mountain (2.5-3.5km)", "thrust_efficiency": 0.82, "power_penalty": 0.22},
-}
+# Profiles used when an Environment names an unknown band.
+_DEFAULT_ALTITUDE = ALTITUDE_BANDS["sea_level"]
+_DEFAULT_TEMPERATURE = TEMPERATURE_BANDS["standard"]
 
-TEMPERATURE_BANDS = {
-    "hot": {"label": "Hot (30C)", "capacity_factor": 0.97},
-    "standard": {"label": "Standard (15C)", "capacity_factor": 1.0},
-    "cold": {"label": "Cold (0C)", "capacity_factor": 0.9},
-    "freezing": {"label": "Freezing (-10C)", "capacity_factor": 0.8},
-}
+# Frozen so instances can key caches; ``slots`` needs Python 3.10+.
+_DATACLASS_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Environment:
     altitude_band: str = "sea_level"
     temperature_band: str = "standard"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ConstraintSettings:
     min_thrust_to_weight: float | None = None
     min_adjusted_endurance_min: float | None = None
     max_auw_kg: float | None = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ComponentSelection:
     frame: str
     propulsion: str
@@ -44,7 +41,7 @@ class ComponentSelection:
     mounted_nodes: Tuple[str, ...] = field(default_factory=tuple)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DesignResult:
     mass_kg: float
     payload_margin_kg: float
@@ -59,7 +56,7 @@ class DesignResult:
 
 
 def _lookup(catalog: Catalog, category: str, component_id: str) -> Dict[str, object]:
-    for item in catalog.get(category, []):
+    for item in catalog.get(category, ()):
         if item.get("id") == component_id:
             return item
     raise KeyError(f"{category} component '{component_id}' not found")
@@ -90,7 +87,11 @@ def evaluate_design(
     radio = items["radio"]
     payloads = items["payloads"]
 
-    total_payload_mass = sum(p["mass_kg"] for p in payloads)
+    total_payload_mass = 0
+    payload_power = 0
+    for p in payloads:
+        total_payload_mass += p["mass_kg"]
+        payload_power += p.get("power_w", 0)
     component_mass = total_payload_mass + propulsion["mass_kg"] + battery["mass_kg"] + compute["mass_kg"] + radio["mass_kg"]
     mass_kg = frame["empty_mass_kg"] + component_mass
 
@@ -98,13 +99,12 @@ def evaluate_design(
     thrust_to_weight = propulsion["thrust_kg"] / mass_kg if mass_kg else 0.0
 
     hover_power = propulsion["hover_power_w"] if frame["type"] != "ground" else propulsion["hover_power_w"] * 0.35
-    payload_power = sum(p.get("power_w", 0) for p in payloads)
     avionics_power = compute["power_w"] + radio["power_w"]
     power_budget = hover_power + payload_power + avionics_power
 
     env = environment or Environment()
-    altitude_profile = ALTITUDE_BANDS.get(env.altitude_band, ALTITUDE_BANDS["sea_level"])
-    temperature_profile = TEMPERATURE_BANDS.get(env.temperature_band, TEMPERATURE_BANDS["standard"])
+    altitude_profile = ALTITUDE_BANDS.get(env.altitude_band) or _DEFAULT_ALTITUDE
+    temperature_profile = TEMPERATURE_BANDS.get(env.temperature_band) or _DEFAULT_TEMPERATURE
 
     adjusted_thrust_to_weight = (
         (propulsion["thrust_kg"] * altitude_profile["thrust_efficiency"]) / mass_kg if mass_kg else 0.0
@@ -117,12 +117,12 @@ def evaluate_design(
     endurance_minutes = endurance_hours * 60
     adjusted_endurance_minutes = adjusted_endurance_hours * 60
 
-    role_tags = sorted({
-        *frame.get("role_tags", []),
-        *radio.get("role_tags", []),
-        *compute.get("role_tags", []),
-        *[tag for p in payloads for tag in p.get("role_tags", [])],
-    })
+    tags = set(frame.get("role_tags", ()))
+    tags.update(radio.get("role_tags", ()))
+    tags.update(compute.get("role_tags", ()))
+    for p in payloads:
+        tags.update(p.get("role_tags", ()))
+    role_tags = sorted(tags)
 
     warnings: List[str] = []
     if payload_margin < 0:
@@ -131,7 +131,7 @@ def evaluate_design(
         warnings.append(
             f"All-up weight {mass_kg:.2f} kg exceeds frame MTOW {frame['max_takeoff_kg']:.2f} kg"
         )
-    if selection.frame not in propulsion.get("compatible_frames", []):
+    if selection.frame not in propulsion.get("compatible_frames", ()):
         warnings.append("Propulsion does not list this frame as compatible")
     if thrust_to_weight < 1.3 and frame["type"] != "ground":
         warnings.append("Thrust-to-weight below 1.3: limited climb/station-keep margin")
@@ -170,6 +170,39 @@ def evaluate_design(
     )
 
 
+# Memoizes evaluate_design for one catalog, which must not change while in use.
+class CachedEvaluator:
+    def __init__(self, catalog: Catalog, maxsize: int | None = 1024) -> None:
+        self.catalog = catalog
+
+        # Close over the catalog, not self, so the cache forms no reference cycle.
+        @lru_cache(maxsize=maxsize)
+        def _evaluate(
+            selection: ComponentSelection,
+            environment: Environment | None,
+            constraints: ConstraintSettings | None,
+        ) -> DesignResult:
+            return evaluate_design(catalog, selection, environment=environment, constraints=constraints)
+
+        self._evaluate = _evaluate
+
+    def evaluate(
+        self,
+        selection: ComponentSelection,
+        environment: Environment | None = None,
+        constraints: ConstraintSettings | None = None,
+    ) -> DesignResult:
+        # evaluate_design accepts list payloads; the cache key needs tuples.
+        selection = replace(
+            selection, payloads=tuple(selection.payloads), mounted_nodes=tuple(selection.mounted_nodes)
+        )
+        cached = self._evaluate(selection, environment, constraints)
+        return replace(cached, role_tags=list(cached.role_tags), warnings=list(cached.warnings))
+
+    def cache_clear(self) -> None:
+        self._evaluate.cache_clear()
+
+
 def list_category(catalog: Catalog, category: str) -> List[Dict[str, object]]:
     if category not in catalog:
         raise KeyError(f"Unknown category: {category}")
@@ -178,7 +211,7 @@ def list_category(catalog: Catalog, category: str) -> List[Dict[str, object]]:
 
 def recommended_roles(catalog: Catalog, role: str) -> List[Dict[str, object]]:
     results: List[Dict[str, object]] = []
-    for payload in catalog.get("payloads", []):
-        if role in payload.get("role_tags", []):
+    for payload in catalog.get("payloads", ()):
+        if role in payload.get("role_tags", ()):
             results.append(payload)
     return results
@@ -0,0 +1,18 @@
+"""Environment band tables shared by the design math and the CLI parser.
+
+Kept free of imports so argparse ``choices`` can be built without pulling
+in the evaluation module.
+"""
+
+ALTITUDE_BANDS = {
+    "sea_level": {"label": "Sea level (0-500m)", "thrust_efficiency": 1.0, "power_penalty": 0.0},
+    "high_desert": {"label": "High desert (1.5-2.5km)", "thrust_efficiency": 0.9, "power_penalty": 0.12},
+    "mountain": {"label": "Mountain (2.5-3.5km)", "thrust_efficiency": 0.82, "power_penalty": 0.22},
+}
+
+TEMPERATURE_BANDS = {
+    "hot": {"label": "Hot (30C)", "capacity_factor": 0.97},
+    "standard": {"label": "Standard (15C)", "capacity_factor": 1.0},
+    "cold": {"label": "Cold (0C)", "capacity_factor": 0.9},
+    "freezing": {"label": "Freezing (-10C)", "capacity_factor": 0.8},
+}